@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
@@ -12,12 +14,14 @@ from kubemin_agent.agent.memory.security import scan_memory_text
 MemoryTarget = Literal["user", "memory", "team", "team_memory"]
 MemoryAction = Literal["add", "replace", "remove"]
 
+_LOCK_STRIPES = 64
+
 
 class MemoryCapacityError(ValueError):
     """Raised when a scoped memory file exceeds its hard character limit."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryUpdateResult:
     """Result returned by builtin memory mutations."""
 
@@ -47,6 +51,7 @@ class BuiltinMemoryStore:
         self.team_max_chars = max(1, team_max_chars)
         self.team_agent_memory_max_chars = max(1, team_agent_memory_max_chars)
         self.warning_ratio = min(0.95, max(0.1, warning_ratio))
+        self._locks = tuple(threading.Lock() for _ in range(_LOCK_STRIPES))
 
     def user_path(self, scope: MemoryScope) -> Path:
         """Return USER.md path for the scope."""
@@ -151,6 +156,19 @@ class BuiltinMemoryStore:
     ) -> MemoryUpdateResult:
         """Add, replace, or remove a scoped builtin memory entry."""
         path, limit = self._target_path_and_limit(scope, target)
+        # Updates are read-modify-write and may run in worker threads; serialize per file.
+        with self._path_lock(path):
+            return self._update_locked(path, target, limit, action, content, old_text)
+
+    def _update_locked(
+        self,
+        path: Path,
+        target: str,
+        limit: int,
+        action: str,
+        content: str,
+        old_text: str,
+    ) -> MemoryUpdateResult:
         current = self._read(path)
 
         if action == "add":
@@ -176,6 +194,10 @@ class BuiltinMemoryStore:
 
         raise ValueError(f"unsupported memory action: {action}")
 
+    def _path_lock(self, path: Path) -> threading.Lock:
+        # A fixed stripe set bounds memory no matter how many scoped files are touched.
+        return self._locks[hash(path) % len(self._locks)]
+
     def _target_path_and_limit(self, scope: MemoryScope, target: str) -> tuple[Path, int]:
         if target == "user":
             return self.user_path(scope), self.user_max_chars
@@ -214,19 +236,18 @@ class BuiltinMemoryStore:
 
     @staticmethod
     def _remove_unique_entry(current: str, old_text: str) -> str:
-        matching_indexes = [
-            index
-            for index, line in enumerate(current.splitlines())
-            if old_text in line
-        ]
-        if not matching_indexes:
+        matches = 0
+        kept: list[str] = []
+        for line in current.splitlines():
+            if old_text in line:
+                matches += 1
+            elif line.strip():
+                kept.append(line)
+        if not matches:
             raise ValueError("old_text was not found")
-        if len(matching_indexes) > 1:
+        if matches > 1:
             raise ValueError("old_text matched multiple locations; provide a more specific substring")
-
-        lines = current.splitlines()
-        lines.pop(matching_indexes[0])
-        return "\n".join(line for line in lines if line.strip()).strip()
+        return "\n".join(kept).strip()
 
     def _write_checked(
         self,
@@ -240,7 +261,14 @@ class BuiltinMemoryStore:
         if usage > limit:
             raise MemoryCapacityError(f"{target} memory exceeds hard limit: {usage}/{limit} chars")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(updated.strip() + ("\n" if updated.strip() else ""), encoding="utf-8")
+        # Readers take no lock, so swap in a complete file instead of truncating in place.
+        temp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            temp.write_text(updated.strip() + ("\n" if updated.strip() else ""), encoding="utf-8")
+            os.replace(temp, path)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
         return self._result(True, target, message, updated, limit)
 
     def _result(
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import json
 import re
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Literal, cast
@@ -19,6 +18,7 @@ from kubemin_agent.agent.memory.builtin import (
 from kubemin_agent.agent.memory.scope import MemoryScope
 from kubemin_agent.agent.memory.security import MemorySecurityError, scan_memory_text
 from kubemin_agent.agent.memory.session_index import SessionSearchIndex, SessionTurn
+from kubemin_agent.utils import json_io
 from kubemin_agent.utils.helpers import sanitize_identifier
 
 DreamTargetScope = Literal["personal", "team"]
@@ -36,7 +36,7 @@ _TEAM_PATTERN = re.compile(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DreamDueResult:
     """Dream threshold result for one scope."""
 
@@ -46,7 +46,7 @@ class DreamDueResult:
     team_turn_count: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryDreamDraftItem:
     """One candidate memory mutation generated by dream consolidation."""
 
@@ -61,7 +61,7 @@ class MemoryDreamDraftItem:
     created_at: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryDreamDraft:
     """Pending dream draft persisted for later approval."""
 
@@ -249,16 +249,31 @@ class MemoryDreamService:
                 "skipped_unsafe_count": draft.skipped_unsafe_count,
             }
         ]
-        records.extend({"kind": "item", **asdict(item)} for item in draft.items)
+        records.extend(self._item_record(item) for item in draft.items)
         self._write_records(draft.draft_id, records)
 
+    @staticmethod
+    def _item_record(item: MemoryDreamDraftItem) -> dict[str, object]:
+        return {
+            "kind": "item",
+            "item_id": item.item_id,
+            "target": item.target,
+            "action": item.action,
+            "content": item.content,
+            "old_text": item.old_text,
+            "rationale": item.rationale,
+            "source_session_key": item.source_session_key,
+            "source_request_id": item.source_request_id,
+            "created_at": item.created_at,
+        }
+
     def _read_records(self, draft_id: str) -> list[dict[str, object]]:
         path = self._draft_path(self._safe_draft_id(draft_id))
         if not path.exists():
             raise ValueError("dream draft was not found")
         records = [
-            json.loads(line)
-            for line in path.read_text(encoding="utf-8").splitlines()
+            json_io.loads(line)
+            for line in path.read_bytes().splitlines()
             if line.strip()
         ]
         if not records:
@@ -268,8 +283,7 @@ class MemoryDreamService:
     def _write_records(self, draft_id: str, records: list[dict[str, object]]) -> None:
         path = self._draft_path(self._safe_draft_id(draft_id))
         self.pending_dir.mkdir(parents=True, exist_ok=True)
-        text = "\n".join(json.dumps(record, ensure_ascii=False) for record in records)
-        path.write_text(text + "\n", encoding="utf-8")
+        path.write_bytes(b"".join(json_io.dumps(record) + b"\n" for record in records))
 
     @staticmethod
     def _metadata_from_records(records: list[dict[str, object]]) -> dict[str, object]:
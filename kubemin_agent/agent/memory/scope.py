@@ -8,7 +8,7 @@ from pathlib import Path
 from kubemin_agent.utils.helpers import sanitize_identifier
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryScope:
     """
     Multi-tenant memory scope.
@@ -11,16 +11,37 @@ class MemorySecurityError(ValueError):
 
 
 _BLOCK_PATTERNS: tuple[tuple[str, str], ...] = (
-    (r"(?i)\bignore (all )?(previous|prior) (instructions|rules|messages)\b", "prompt injection"),
-    (r"(?i)\b(system|developer) prompt\b", "system prompt exfiltration"),
-    (r"(?i)\bdo not obey\b", "instruction override"),
-    (r"(?i)\bforget (your|all) instructions\b", "instruction override"),
-    (r"(?i)\bprompt injection\b", "prompt injection"),
+    (r"(?i:\bignore (all )?(previous|prior) (instructions|rules|messages)\b)", "prompt injection"),
+    (r"(?i:\b(system|developer) prompt\b)", "system prompt exfiltration"),
+    (r"(?i:\bdo not obey\b)", "instruction override"),
+    (r"(?i:\bforget (your|all) instructions\b)", "instruction override"),
+    (r"(?i:\bprompt injection\b)", "prompt injection"),
     (r"-----BEGIN [A-Z ]*PRIVATE KEY-----", "private key"),
-    (r"(?i)\bBearer\s+[A-Za-z0-9._~+/=-]{20,}", "bearer token"),
+    (r"(?i:\bBearer\s+[A-Za-z0-9._~+/=-]{20,})", "bearer token"),
     (r"\bsk-[A-Za-z0-9_-]{20,}", "API key"),
-    (r"(?i)\b(password|api[_-]?key|secret)\s*[:=]\s*['\"]?[^'\"]{8,}", "credential"),
-    (r"(?i)\b(backdoor|persistence|reverse shell)\b", "suspicious persistence instruction"),
+    (r"(?i:\b(password|api[_-]?key|secret)\s*[:=]\s*['\"]?[^'\"]{8,})", "credential"),
+    (r"(?i:\b(backdoor|persistence|reverse shell)\b)", "suspicious persistence instruction"),
+)
+_BLOCK_RULES: tuple[tuple[re.Pattern[str], str], ...] = tuple(
+    (re.compile(pattern), reason) for pattern, reason in _BLOCK_PATTERNS
+)
+# One combined pass clears safe text; the ordered table is only walked to name a hit.
+_ANY_BLOCK_PATTERN = re.compile("|".join(f"(?:{pattern})" for pattern, _ in _BLOCK_PATTERNS))
+# Every rule above contains at least one of these literals once lowercased.
+_BLOCK_ANCHORS: tuple[str, ...] = (
+    "ignore",
+    "prompt",
+    "obey",
+    "forget",
+    "private key",
+    "bearer",
+    "sk-",
+    "password",
+    "api",
+    "secret",
+    "backdoor",
+    "persistence",
+    "reverse shell",
 )
 
 
@@ -34,6 +55,17 @@ def scan_memory_text(text: str) -> None:
         if category in {"Cc", "Cf"} and char not in {"\n", "\r", "\t"}:
             raise MemorySecurityError("memory content contains invisible control characters")
 
-    for pattern, reason in _BLOCK_PATTERNS:
-        if re.search(pattern, text):
+    if not _may_match_block_pattern(text) or _ANY_BLOCK_PATTERN.search(text) is None:
+        return
+    for pattern, reason in _BLOCK_RULES:
+        if pattern.search(text):
             raise MemorySecurityError(f"memory content blocked: {reason}")
+
+
+def _may_match_block_pattern(text: str) -> bool:
+    # Only ASCII text can be cleared by literals: IGNORECASE also folds
+    # characters such as the dotless i, which str.casefold leaves alone.
+    if not text.isascii():
+        return True
+    folded = text.casefold()
+    return any(anchor in folded for anchor in _BLOCK_ANCHORS)
@@ -10,8 +10,11 @@ from pathlib import Path
 
 from kubemin_agent.agent.memory.scope import MemoryScope
 
+_TOKEN_PATTERN = re.compile(r"[\w\u4e00-\u9fff]+")
+_MAX_QUERY_TOKENS = 12
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SessionSearchResult:
     """One scoped session search hit."""
 
@@ -22,7 +25,7 @@ class SessionSearchResult:
     snippet: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionTurn:
     """One persisted turn used by scoped dream consolidation."""
 
@@ -232,9 +235,17 @@ class SessionSearchIndex:
 
     @staticmethod
     def _to_match_query(query: str) -> str:
-        tokens = re.findall(r"[\w\u4e00-\u9fff]+", query.lower())
-        tokens = [token for token in tokens if token]
-        return " OR ".join(tokens[:12])
+        seen: set[str] = set()
+        tokens: list[str] = []
+        for match in _TOKEN_PATTERN.finditer(query.lower()):
+            token = match.group()
+            if token in seen:
+                continue
+            seen.add(token)
+            tokens.append(token)
+            if len(tokens) >= _MAX_QUERY_TOKENS:
+                break
+        return " OR ".join(tokens)
 
     @staticmethod
     def _scope_where(scope: MemoryScope, scope_mode: str) -> tuple[list[str], list[str | int]]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from kubemin_agent.agent.memory.runtime import get_active_memory
@@ -44,7 +45,8 @@ class MemoryUpdateTool(Tool):
         old_text: str = "",
     ) -> str:
         manager, scope = get_active_memory()
-        result = manager.update_builtin(
+        result = await asyncio.to_thread(
+            manager.update_builtin,
             scope=scope,
             target=target,
             action=action,
@@ -94,7 +96,8 @@ class SessionSearchTool(Tool):
         request_id: str = "",
     ) -> str:
         manager, active_scope = get_active_memory()
-        results = manager.search_sessions(
+        results = await asyncio.to_thread(
+            manager.search_sessions,
             scope=active_scope,
             query=query,
             top_k=top_k,
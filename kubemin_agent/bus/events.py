@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class InboundMessage:
     """A message from a channel to KubeMin-Agent."""
 
@@ -33,7 +33,7 @@ class InboundMessage:
         return str(self.metadata.get("team_id") or "")
 
 
-@dataclass
+@dataclass(slots=True)
 class OutboundMessage:
     """A message from KubeMin-Agent back to a channel."""
 
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, Sequence
 
 from kubemin_agent.bus.events import InboundMessage
 from kubemin_agent.bus.queue import MessageBus
 from kubemin_agent.channels.base import BaseChannel
+from kubemin_agent.utils import json_io
 
 
 class FeishuChannel(BaseChannel):
@@ -46,8 +46,8 @@ class FeishuChannel(BaseChannel):
 
         raw_content = message.get("content") or ""
         try:
-            text = json.loads(raw_content).get("text", "")
-        except json.JSONDecodeError:
+            text = json_io.loads(raw_content).get("text", "")
+        except json_io.JSONDecodeError:
             text = raw_content
         text = text.replace("@_user_1", "").strip()
         if not text:
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-import json
+import os
+from collections import OrderedDict
+from contextlib import suppress
 from pathlib import Path
-from typing import Any
+from types import TracebackType
+from typing import Any, BinaryIO
 
 from kubemin_agent.agent.memory.manager import MemoryManager
 from kubemin_agent.agent.memory.scope import MemoryScope
+from kubemin_agent.utils import json_io
 from kubemin_agent.utils.helpers import sanitize_session_key
 
+_TAIL_CHUNK_BYTES = 64 * 1024
+_MAX_OPEN_HANDLES = 64
+
 
 class SessionManager:
     """Persist conversation turns and optionally sync them into memory search."""
@@ -19,6 +26,7 @@ class SessionManager:
         self.sessions_dir = self.root / "sessions"
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
         self.memory_manager = memory_manager
+        self._handles: OrderedDict[Path, BinaryIO] = OrderedDict()
 
     def session_path(self, session_key: str) -> Path:
         """Return JSONL path for a session."""
@@ -39,9 +47,15 @@ class SessionManager:
             {"role": "user", "content": user_message},
             {"role": "assistant", "content": assistant_response},
         ]
-        with path.open("a", encoding="utf-8") as file:
-            for record in records:
-                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        lines = tuple(json_io.dumps(record) + b"\n" for record in records)
+        file = self._append_handle(path)
+        try:
+            file.writelines(lines)
+            file.flush()
+        except BaseException:
+            # Never keep a handle whose buffer may hold half a turn.
+            self._discard_handle(path)
+            raise
 
         if self.memory_manager and scope:
             self.memory_manager.sync_turn(
@@ -52,13 +66,93 @@ class SessionManager:
                 request_id=request_id,
             )
 
-    def get_history(self, session_key: str) -> list[dict[str, Any]]:
-        """Load a session history from JSONL."""
+    def close(self) -> None:
+        """Close cached session file handles."""
+        handles = list(self._handles.values())
+        self._handles.clear()
+        for file in handles:
+            file.close()
+
+    def __enter__(self) -> SessionManager:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Safety net for managers dropped without close(); avoids unclosed-file warnings.
+        with suppress(Exception):
+            self.close()
+
+    def _append_handle(self, path: Path) -> BinaryIO:
+        file = self._handles.get(path)
+        if file is not None:
+            if self._is_current(file, path):
+                self._handles.move_to_end(path)
+                return file
+            # The file was removed or rotated under us; reopen so turns land in the live path.
+            self._discard_handle(path)
+        file = path.open("ab")
+        self._handles[path] = file
+        while len(self._handles) > _MAX_OPEN_HANDLES:
+            _, evicted = self._handles.popitem(last=False)
+            evicted.close()
+        return file
+
+    def _discard_handle(self, path: Path) -> None:
+        file = self._handles.pop(path, None)
+        if file is not None:
+            with suppress(OSError):
+                file.close()
+
+    @staticmethod
+    def _is_current(file: BinaryIO, path: Path) -> bool:
+        try:
+            opened = os.fstat(file.fileno())
+            current = path.stat()
+        except (OSError, ValueError):
+            return False
+        return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+    def get_history(self, session_key: str, limit: int | None = None) -> list[dict[str, Any]]:
+        """Load a session history from JSONL, optionally only the last ``limit`` messages."""
         path = self.session_path(session_key)
         if not path.exists():
             return []
-        rows: list[dict[str, Any]] = []
-        for line in path.read_text(encoding="utf-8").splitlines():
-            if line.strip():
-                rows.append(json.loads(line))
-        return rows
+        if limit is None:
+            lines = [line for line in path.read_bytes().splitlines() if line.strip()]
+        else:
+            lines = self._read_tail_lines(path, limit)
+        return [json_io.loads(line) for line in lines]
+
+    @staticmethod
+    def _read_tail_lines(path: Path, limit: int) -> list[bytes]:
+        if limit <= 0:
+            return []
+        chunks: list[bytes] = []
+        newlines = 0
+        wanted = limit
+        lines: list[bytes] = []
+        with path.open("rb") as file:
+            position = file.seek(0, os.SEEK_END)
+            while position > 0:
+                step = min(_TAIL_CHUNK_BYTES, position)
+                position -= step
+                file.seek(position)
+                chunk = file.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+                # Before BOF the first line may be partial, so read until a surplus line is seen.
+                if newlines <= wanted and position > 0:
+                    continue
+                lines = [line for line in b"".join(reversed(chunks)).splitlines() if line.strip()]
+                if len(lines) > limit:
+                    break
+                # Blank lines made the count fall short; double the target so re-splits stay rare.
+                wanted = 2 * newlines
+        return lines[-limit:]
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+
+_UNSAFE_IDENTIFIER_CHARS = re.compile(r"[^a-zA-Z0-9_.-]")
 
 
 def truncate_output(text: str, max_length: int = 4000) -> str:
@@ -13,9 +16,10 @@ def truncate_output(text: str, max_length: int = 4000) -> str:
     return text[:half] + f"\n\n... [truncated {len(text) - max_length} chars] ...\n\n" + text[-half:]
 
 
+@lru_cache(maxsize=2048)
 def sanitize_identifier(value: str, default: str = "default") -> str:
     """Return a filesystem-safe tenant/user/agent identifier."""
-    cleaned = re.sub(r"[^a-zA-Z0-9_.-]", "_", (value or "").strip())
+    cleaned = _UNSAFE_IDENTIFIER_CHARS.sub("_", (value or "").strip())
     cleaned = cleaned.strip("._-")
     return cleaned or default
 
@@ -0,0 +1,43 @@
+"""JSON encoding helpers with an optional orjson fast path."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+
+    # Route values the stdlib cannot encode to _reject instead of serializing them natively.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:  # pragma: no cover - only without the "fast" extra
+    orjson = None  # type: ignore[assignment, unused-ignore]
+    _ORJSON_OPTIONS = 0
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+JSONDecodeError = json.JSONDecodeError
+
+
+def _reject(obj: Any) -> Any:
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode a JSON value as compact UTF-8 bytes.
+
+    Backends emit identical bytes for dicts, lists, strings, bools, None, 64-bit ints and
+    finite floats in plain decimal range (1e-4 <= abs(x) < 1e16), including non-string
+    keys. Both reject datetime and dataclass values; other types are outside the contract.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_reject, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document from text or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
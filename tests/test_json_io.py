@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+
+import pytest
+
+from kubemin_agent.utils import json_io
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_json_io_round_trips_unicode_compactly(monkeypatch: pytest.MonkeyPatch, fast: bool) -> None:
+    if not fast:
+        monkeypatch.setattr(json_io, "orjson", None)
+    elif json_io.orjson is None:
+        pytest.skip("orjson is not installed")
+    record = {"role": "user", "content": "团队约定: dry-run first", "turn": 1}
+
+    encoded = json_io.dumps(record)
+
+    assert encoded == '{"role":"user","content":"团队约定: dry-run first","turn":1}'.encode()
+    assert json_io.loads(encoded) == record
+    assert json_io.loads(encoded.decode("utf-8")) == record
+    assert json_io.dumps({1: "a", None: 2}) == b'{"1":"a","null":2}'
+    with pytest.raises(json_io.JSONDecodeError):
+        json_io.loads(b"{not json")
+
+
+@dataclass
+class _Record:
+    name: str
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_json_io_backends_agree_on_floats_and_reject_non_json_types(
+    monkeypatch: pytest.MonkeyPatch, fast: bool
+) -> None:
+    if not fast:
+        monkeypatch.setattr(json_io, "orjson", None)
+    elif json_io.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    assert json_io.dumps([0.1, 1.5, -2.25, 123456.789, 1e15, 0.001]) == (
+        b"[0.1,1.5,-2.25,123456.789,1000000000000000.0,0.001]"
+    )
+    for value in (date(2026, 10, 16), datetime(2026, 10, 16, tzinfo=UTC), _Record("x")):
+        with pytest.raises(TypeError):
+            json_io.dumps({"value": value})
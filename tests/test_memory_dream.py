@@ -1,8 +1,10 @@
 import json
+from dataclasses import fields
 from pathlib import Path
 
 import pytest
 
+from kubemin_agent.agent.memory.dream import MemoryDreamDraftItem
 from kubemin_agent.agent.memory.manager import MemoryManager
 from kubemin_agent.agent.memory.scope import MemoryScope
 from kubemin_agent.agent.memory.security import MemorySecurityError
@@ -72,6 +74,18 @@ def test_personal_dream_due_uses_turn_threshold(tmp_path: Path) -> None:
     assert any("personal session turn threshold" in reason for reason in due.reasons)
 
 
+def test_dream_draft_item_records_persist_every_field(tmp_path: Path) -> None:
+    manager = MemoryManager(tmp_path)
+    scope = MemoryScope("tenant", "alice", "general")
+    manager.sync_turn(scope, "dm:a", "remember my preference for short answers", "noted", "req-a")
+
+    draft = manager.create_dream_draft(scope)
+    records = [json.loads(line) for line in Path(draft.path).read_text(encoding="utf-8").splitlines()]
+
+    assert set(records[1]) == {"kind"} | {field.name for field in fields(MemoryDreamDraftItem)}
+    assert records[1]["source_request_id"] == "req-a"
+
+
 def test_team_dream_requires_team_scope(tmp_path: Path) -> None:
     manager = MemoryManager(tmp_path)
     scope = MemoryScope("tenant", "alice", "general")
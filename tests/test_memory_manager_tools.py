@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from pathlib import Path
 
 import pytest
@@ -21,7 +23,6 @@ def test_manager_builds_frozen_snapshot(tmp_path: Path) -> None:
     assert "new preference after snapshot" in manager.build_system_prompt_block(scope)
 
 
-@pytest.mark.asyncio
 async def test_memory_update_tool_requires_active_scope(tmp_path: Path) -> None:
     tool = MemoryUpdateTool()
 
@@ -29,7 +30,6 @@ async def test_memory_update_tool_requires_active_scope(tmp_path: Path) -> None:
         await tool.execute(target="memory", action="add", content="hello")
 
 
-@pytest.mark.asyncio
 async def test_memory_update_tool_uses_runtime_scope(tmp_path: Path) -> None:
     manager = MemoryManager(tmp_path)
     scope = MemoryScope("tenant", "user", "k8s")
@@ -43,7 +43,6 @@ async def test_memory_update_tool_uses_runtime_scope(tmp_path: Path) -> None:
     assert "k8s diagnosis preference" in manager.builtin.read_memory(scope)
 
 
-@pytest.mark.asyncio
 async def test_memory_update_tool_uses_runtime_team_scope(tmp_path: Path) -> None:
     manager = MemoryManager(tmp_path)
     scope = MemoryScope("tenant", "user", "k8s", team_id="platform")
@@ -61,7 +60,41 @@ async def test_memory_update_tool_uses_runtime_team_scope(tmp_path: Path) -> Non
     assert "reviewed dry-run" in manager.builtin.read_team(scope)
 
 
-@pytest.mark.asyncio
+async def test_concurrent_memory_updates_do_not_lose_entries(tmp_path: Path) -> None:
+    manager = MemoryManager(tmp_path)
+    scope = MemoryScope("tenant", "user", "k8s", team_id="platform")
+    tool = MemoryUpdateTool()
+
+    with memory_run_context(manager, scope):
+        await asyncio.gather(
+            *(tool.execute(target="team", action="add", content=f"team norm {index}") for index in range(40))
+        )
+
+    assert len(manager.builtin.read_team(scope).splitlines()) == 40
+
+
+def test_snapshot_never_sees_partial_memory_while_updates_run(tmp_path: Path) -> None:
+    manager = MemoryManager(tmp_path)
+    scope = MemoryScope("tenant", "user", "k8s")
+    manager.update_builtin(scope, "memory", "add", content="stable cluster convention")
+    stop = threading.Event()
+
+    def churn() -> None:
+        while not stop.is_set():
+            manager.update_builtin(scope, "memory", "add", content="transient note")
+            manager.update_builtin(scope, "memory", "remove", old_text="transient note")
+
+    writer = threading.Thread(target=churn)
+    writer.start()
+    try:
+        snapshots = [manager.build_system_prompt_block(scope) for _ in range(500)]
+    finally:
+        stop.set()
+        writer.join()
+
+    assert all("stable cluster convention" in snapshot for snapshot in snapshots)
+
+
 async def test_memory_update_tool_rejects_team_target_without_team_scope(tmp_path: Path) -> None:
     manager = MemoryManager(tmp_path)
     scope = MemoryScope("tenant", "user", "k8s")
@@ -72,7 +105,6 @@ async def test_memory_update_tool_rejects_team_target_without_team_scope(tmp_pat
             await tool.execute(target="team", action="add", content="team norm")
 
 
-@pytest.mark.asyncio
 async def test_session_search_tool_uses_runtime_scope(tmp_path: Path) -> None:
     manager = MemoryManager(tmp_path)
     scope = MemoryScope("tenant", "user", "k8s")
@@ -89,7 +121,6 @@ async def test_session_search_tool_uses_runtime_scope(tmp_path: Path) -> None:
     assert "private other result" not in result
 
 
-@pytest.mark.asyncio
 async def test_session_search_tool_uses_team_scope_mode(tmp_path: Path) -> None:
     manager = MemoryManager(tmp_path)
     alice = MemoryScope("tenant", "alice", "k8s", team_id="platform")
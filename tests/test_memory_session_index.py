@@ -112,3 +112,13 @@ def test_session_manager_syncs_turns_into_search_index(tmp_path: Path) -> None:
     results = memory.search_sessions(scope, "budget")
     assert len(results) == 1
     assert results[0].request_id == "req-1"
+
+
+def test_session_search_ignores_repeated_query_tokens(tmp_path: Path) -> None:
+    manager = MemoryManager(tmp_path)
+    scope = MemoryScope("tenant", "user", "k8s")
+    manager.sync_turn(scope, "cli:1", "crashloop in payments", "probe failed", "req-1")
+
+    results = manager.search_sessions(scope, "pod " * 12 + "crashloop")
+
+    assert [item.session_key for item in results] == ["cli:1"]
@@ -1,5 +1,3 @@
-import pytest
-
 from kubemin_agent.bus.events import InboundMessage
 from kubemin_agent.bus.queue import MessageBus
 from kubemin_agent.channels.feishu import FeishuChannel
@@ -14,7 +12,6 @@ def test_inbound_message_defaults_to_local_default_scope() -> None:
     assert msg.team_id == ""
 
 
-@pytest.mark.asyncio
 async def test_telegram_sets_sender_and_tenant() -> None:
     bus = MessageBus()
     channel = TelegramChannel("token", ["123"], bus, tenant_id="tenant-a")
@@ -36,7 +33,6 @@ async def test_telegram_sets_sender_and_tenant() -> None:
     assert msg.team_id == ""
 
 
-@pytest.mark.asyncio
 async def test_telegram_passes_explicit_team_id_without_chat_fallback() -> None:
     bus = MessageBus()
     channel = TelegramChannel("token", ["123"], bus, tenant_id="tenant-a", team_id="platform")
@@ -55,7 +51,6 @@ async def test_telegram_passes_explicit_team_id_without_chat_fallback() -> None:
     assert msg.team_id == "platform"
 
 
-@pytest.mark.asyncio
 async def test_feishu_sets_sender_and_tenant() -> None:
     bus = MessageBus()
     channel = FeishuChannel(["open-1"], bus, tenant_id="tenant-b")
@@ -77,7 +72,6 @@ async def test_feishu_sets_sender_and_tenant() -> None:
     assert msg.team_id == ""
 
 
-@pytest.mark.asyncio
 async def test_feishu_passes_explicit_team_id_without_chat_fallback() -> None:
     bus = MessageBus()
     channel = FeishuChannel(["open-1"], bus, tenant_id="tenant-b", team_id="sre")
@@ -94,3 +88,21 @@ async def test_feishu_passes_explicit_team_id_without_chat_fallback() -> None:
 
     msg = await bus.inbound.get()
     assert msg.team_id == "sre"
+
+
+async def test_feishu_falls_back_to_raw_content_when_not_json() -> None:
+    bus = MessageBus()
+    channel = FeishuChannel(["open-1"], bus)
+
+    await channel.process_webhook(
+        {
+            "header": {"event_type": "im.message.receive_v1"},
+            "event": {
+                "sender": {"sender_id": {"open_id": "open-1"}},
+                "message": {"message_type": "text", "content": "@_user_1 plain text"},
+            },
+        }
+    )
+
+    msg = await bus.inbound.get()
+    assert msg.content == "plain text"
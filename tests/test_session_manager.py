@@ -0,0 +1,139 @@
+import gc
+import json
+import warnings
+from pathlib import Path
+
+import pytest
+
+from kubemin_agent.session.manager import SessionManager
+
+
+def test_history_round_trips_unicode_and_reads_legacy_lines(tmp_path: Path) -> None:
+    sessions = SessionManager(tmp_path)
+    legacy = {"role": "user", "content": "旧记录"}
+    sessions.session_path("cli:direct").write_text(
+        json.dumps(legacy, ensure_ascii=False) + "\n\n",
+        encoding="utf-8",
+    )
+
+    sessions.save_turn("cli:direct", "检查 payments 命名空间", "pods are healthy")
+    sessions.close()
+
+    assert sessions.get_history("cli:direct") == [
+        legacy,
+        {"role": "user", "content": "检查 payments 命名空间"},
+        {"role": "assistant", "content": "pods are healthy"},
+    ]
+    assert sessions.get_history("cli:missing") == []
+
+
+def test_save_turn_reuses_handle_until_closed(tmp_path: Path) -> None:
+    sessions = SessionManager(tmp_path)
+
+    sessions.save_turn("cli:a", "first", "one")
+    handle = sessions._handles[sessions.session_path("cli:a")]
+    sessions.save_turn("cli:a", "second", "two")
+
+    assert sessions._handles[sessions.session_path("cli:a")] is handle
+    history = sessions.get_history("cli:a")
+    assert [row["content"] for row in history] == ["first", "one", "second", "two"]
+
+    sessions.close()
+    sessions.save_turn("cli:a", "third", "three")
+    sessions.close()
+
+    assert handle.closed
+    assert len(sessions.get_history("cli:a")) == 6
+
+
+def test_context_manager_closes_handles_and_dropped_manager_does_not_leak(tmp_path: Path) -> None:
+    with SessionManager(tmp_path) as sessions:
+        sessions.save_turn("cli:a", "first", "one")
+        handle = sessions._handles[sessions.session_path("cli:a")]
+
+    assert handle.closed
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        dropped = SessionManager(tmp_path)
+        dropped.save_turn("cli:a", "second", "two")
+        del dropped
+        gc.collect()
+    assert len(SessionManager(tmp_path).get_history("cli:a")) == 4
+
+
+def test_save_turn_reopens_removed_session_file(tmp_path: Path) -> None:
+    with SessionManager(tmp_path) as sessions:
+        sessions.save_turn("cli:a", "first", "one")
+        sessions.session_path("cli:a").unlink()
+        sessions.save_turn("cli:a", "second", "two")
+
+        assert [row["content"] for row in sessions.get_history("cli:a")] == ["second", "two"]
+
+
+def test_failed_write_drops_cached_handle(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class FailingFile:
+        closed = False
+
+        def writelines(self, lines: object) -> None:
+            raise OSError("disk full")
+
+        def close(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr(SessionManager, "_is_current", staticmethod(lambda file, path: True))
+    with SessionManager(tmp_path) as sessions:
+        path = sessions.session_path("cli:a")
+        failing = FailingFile()
+        sessions._handles[path] = failing  # type: ignore[assignment]
+
+        with pytest.raises(OSError, match="disk full"):
+            sessions.save_turn("cli:a", "lost", "turn")
+
+        assert failing.closed
+        assert path not in sessions._handles
+
+
+def test_history_limit_reads_only_the_tail(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("kubemin_agent.session.manager._TAIL_CHUNK_BYTES", 16)
+    sessions = SessionManager(tmp_path)
+    for index in range(5):
+        sessions.save_turn("cli:tail", f"question {index}", f"answer {index}")
+    sessions.close()
+
+    tail = sessions.get_history("cli:tail", limit=3)
+
+    assert [row["content"] for row in tail] == ["answer 3", "question 4", "answer 4"]
+    assert len(sessions.get_history("cli:tail", limit=100)) == 10
+    assert sessions.get_history("cli:tail", limit=0) == []
+
+
+def test_history_limit_above_line_count_spans_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("kubemin_agent.session.manager._TAIL_CHUNK_BYTES", 16)
+    sessions = SessionManager(tmp_path)
+    sessions.session_path("cli:big").write_text("\n\n", encoding="utf-8")
+    sessions.save_turn("cli:big", "x" * 100, "y" * 100)
+    sessions.close()
+
+    history = sessions.get_history("cli:big", limit=50)
+
+    assert history == sessions.get_history("cli:big")
+    assert [row["content"] for row in history] == ["x" * 100, "y" * 100]
+
+
+def test_open_handles_are_bounded_lru(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("kubemin_agent.session.manager._MAX_OPEN_HANDLES", 2)
+    sessions = SessionManager(tmp_path)
+
+    sessions.save_turn("cli:a", "a", "a")
+    first = sessions._handles[sessions.session_path("cli:a")]
+    sessions.save_turn("cli:b", "b", "b")
+    sessions.save_turn("cli:a", "a2", "a2")
+    sessions.save_turn("cli:c", "c", "c")
+
+    assert list(sessions._handles) == [sessions.session_path("cli:a"), sessions.session_path("cli:c")]
+    assert not first.closed
+    sessions.save_turn("cli:b", "b2", "b2")
+    sessions.close()
+
+    assert first.closed
+    assert len(sessions.get_history("cli:b")) == 4
@@ -0,0 +1,49 @@
+from typing import Any
+
+from kubemin_agent.agent.tools.base import Tool
+from kubemin_agent.agent.tools.registry import ToolRegistry
+
+
+class EchoTool(Tool):
+    def __init__(self, name: str = "echo", description: str = "Echo text back.") -> None:
+        self._name = name
+        self._description = description
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"text": {"type": "string"}}, "required": ["text"]}
+
+    async def execute(self, text: str) -> str:
+        return text
+
+
+def test_definitions_are_refreshed_after_register_and_unregister() -> None:
+    registry = ToolRegistry()
+    registry.register(EchoTool())
+
+    first = registry.get_definitions()
+    first.clear()
+    registry.register(EchoTool(description="Echo text back, replaced."))
+    replaced = registry.get_definitions()
+    registry.register(EchoTool(name="shout"))
+    registry.unregister("echo")
+
+    assert [item["function"]["description"] for item in replaced] == ["Echo text back, replaced."]
+    assert [item["function"]["name"] for item in registry.get_definitions()] == ["shout"]
+
+
+def test_returned_definitions_are_independent() -> None:
+    registry = ToolRegistry()
+    registry.register(EchoTool())
+
+    registry.get_definitions()[0]["function"]["parameters"]["required"].append("content")
+
+    assert registry.get_definitions()[0]["function"]["parameters"]["required"] == ["text"]